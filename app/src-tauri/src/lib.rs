@@ -134,6 +134,8 @@ fn is_list_type(t: &str) -> bool {
 //  4. 只输出有意义的自定义属性，过滤 BlockNote 内部默认值
 // ===============================
 fn blocks_to_markdown(blocks: &Vec<Value>, indent_level: usize) -> String {
+    // 直接 write! 进同一个缓冲区，避免每一行先 format! 出临时 String 再拷贝
+    use std::fmt::Write as _;
     let mut md_text = String::new();
     let indent = "  ".repeat(indent_level);
     let mut list_counter: usize = 0;
@@ -158,12 +160,12 @@ fn blocks_to_markdown(blocks: &Vec<Value>, indent_level: usize) -> String {
             // 根据 type 精准匹配前缀
             match block_type {
                 "bulletListItem" => {
-                    md_text.push_str(&format!("{}- {}\n", indent, text_content));
+                    let _ = writeln!(md_text, "{}- {}", indent, text_content);
                     list_counter = 0;
                 },
                 "numberedListItem" => {
                     list_counter += 1;
-                    md_text.push_str(&format!("{}{}. {}\n", indent, list_counter, text_content));
+                    let _ = writeln!(md_text, "{}{}. {}", indent, list_counter, text_content);
                 },
                 "heading" => {
                     let level = props
@@ -175,7 +177,7 @@ fn blocks_to_markdown(blocks: &Vec<Value>, indent_level: usize) -> String {
                     if !md_text.is_empty() && !md_text.ends_with("\n\n") {
                         md_text.push('\n');
                     }
-                    md_text.push_str(&format!("{}{} {}\n\n", indent, hashes, text_content));
+                    let _ = writeln!(md_text, "{}{} {}\n", indent, hashes, text_content);
                     list_counter = 0;
                 },
                 "checkListItem" => {
@@ -184,7 +186,7 @@ fn blocks_to_markdown(blocks: &Vec<Value>, indent_level: usize) -> String {
                         .and_then(|c| c.as_bool())
                         .unwrap_or(false);
                     let mark = if checked { "x" } else { " " };
-                    md_text.push_str(&format!("{}- [{}] {}\n", indent, mark, text_content));
+                    let _ = writeln!(md_text, "{}- [{}] {}", indent, mark, text_content);
                     list_counter = 0;
                 },
                 "codeBlock" => {
@@ -192,9 +194,9 @@ fn blocks_to_markdown(blocks: &Vec<Value>, indent_level: usize) -> String {
                         .and_then(|p| p.get("language"))
                         .and_then(|l| l.as_str())
                         .unwrap_or("");
-                    md_text.push_str(&format!("{}```{}\n", indent, language));
-                    md_text.push_str(&format!("{}{}\n", indent, text_content));
-                    md_text.push_str(&format!("{}```\n\n", indent));
+                    let _ = writeln!(md_text, "{}```{}", indent, language);
+                    let _ = writeln!(md_text, "{}{}", indent, text_content);
+                    let _ = writeln!(md_text, "{}```\n", indent);
                     list_counter = 0;
                 },
                 "image" => {
@@ -207,7 +209,7 @@ fn blocks_to_markdown(blocks: &Vec<Value>, indent_level: usize) -> String {
                         .and_then(|c| c.as_str())
                         .unwrap_or("image");
                     if !url.is_empty() {
-                        md_text.push_str(&format!("{}![{}]({})\n\n", indent, caption, url));
+                        let _ = writeln!(md_text, "{}![{}]({})\n", indent, caption, url);
                     }
                     list_counter = 0;
                 },
@@ -221,7 +223,7 @@ fn blocks_to_markdown(blocks: &Vec<Value>, indent_level: usize) -> String {
                         .and_then(|n| n.as_str())
                         .unwrap_or(block_type);
                     if !url.is_empty() {
-                        md_text.push_str(&format!("{}[{}]({})\n\n", indent, name, url));
+                        let _ = writeln!(md_text, "{}[{}]({})\n", indent, name, url);
                     }
                     list_counter = 0;
                 },
@@ -240,11 +242,11 @@ fn blocks_to_markdown(blocks: &Vec<Value>, indent_level: usize) -> String {
                                             cell_texts.push(String::new());
                                         }
                                     }
-                                    md_text.push_str(&format!("{}| {} |\n", indent, cell_texts.join(" | ")));
+                                    let _ = writeln!(md_text, "{}| {} |", indent, cell_texts.join(" | "));
                                     // 在第一行后插入表格分隔线
                                     if row_idx == 0 {
                                         let sep: Vec<String> = cell_texts.iter().map(|_| "---".to_string()).collect();
-                                        md_text.push_str(&format!("{}| {} |\n", indent, sep.join(" | ")));
+                                        let _ = writeln!(md_text, "{}| {} |", indent, sep.join(" | "));
                                     }
                                 }
                             }
@@ -258,7 +260,7 @@ fn blocks_to_markdown(blocks: &Vec<Value>, indent_level: usize) -> String {
                     if text_content.is_empty() {
                         md_text.push('\n');
                     } else {
-                        md_text.push_str(&format!("{}{}\n", indent, text_content));
+                        let _ = writeln!(md_text, "{}{}", indent, text_content);
                     }
                     list_counter = 0;
                 }
@@ -272,13 +274,13 @@ fn blocks_to_markdown(blocks: &Vec<Value>, indent_level: usize) -> String {
                         // 属性以独立缩进行呈现，保证视觉可读性
                         match v {
                             Value::String(s) => {
-                                md_text.push_str(&format!("{}{}:: {}\n", prop_indent, k, s));
+                                let _ = writeln!(md_text, "{}{}:: {}", prop_indent, k, s);
                             },
                             Value::Bool(b) => {
-                                md_text.push_str(&format!("{}{}:: {}\n", prop_indent, k, b));
+                                let _ = writeln!(md_text, "{}{}:: {}", prop_indent, k, b);
                             },
                             Value::Number(n) => {
-                                md_text.push_str(&format!("{}{}:: {}\n", prop_indent, k, n));
+                                let _ = writeln!(md_text, "{}{}:: {}", prop_indent, k, n);
                             },
                             _ => {}
                         }
@@ -318,6 +320,7 @@ fn blocks_to_markdown(blocks: &Vec<Value>, indent_level: usize) -> String {
 }
 
 use std::sync::{Arc, Mutex};
+use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
 use std::time::{Duration, Instant};
 use std::path::Path;
 use std::thread;
@@ -343,7 +346,25 @@ fn get_config_path() -> std::path::PathBuf {
     }
 }
 
+// 已解析的 Vault 路径缓存：各命令频繁调用 get_vault_dir，避免每次都读取并解析 config.json
+// 仅在 set_vault_path 中更新
+static VAULT_DIR: Mutex<Option<std::path::PathBuf>> = Mutex::new(None);
+
 fn get_vault_dir() -> std::path::PathBuf {
+    let mut cached = VAULT_DIR.lock().unwrap();
+    if let Some(dir) = cached.as_ref() {
+        return dir.clone();
+    }
+    let dir = read_vault_dir_from_config();
+    // 初始化常规子目录（必须在扫描前创建，否则新库连空文件夹都看不到）
+    // 只在首次解析时执行一次，切换库时由 set_vault_path 负责
+    let _ = fs::create_dir_all(dir.join("pages"));
+    let _ = fs::create_dir_all(dir.join("journals"));
+    *cached = Some(dir.clone());
+    dir
+}
+
+fn read_vault_dir_from_config() -> std::path::PathBuf {
     let config_path = get_config_path();
     if config_path.exists() {
         if let Ok(content) = std::fs::read_to_string(&config_path) {
@@ -363,11 +384,22 @@ fn get_vault_dir() -> std::path::PathBuf {
     }
 }
 
+// 读取目录项类型：file_type() 直接取自 read_dir 的结果，多数平台无需额外 stat；
+// 仅符号链接才跟随到目标判断，保持与 is_dir()/is_file() 一致的语义
+fn entry_kind(entry: &std::fs::DirEntry, path: &std::path::Path) -> (bool, bool) {
+    match entry.file_type() {
+        Ok(ft) if ft.is_symlink() => (path.is_dir(), path.is_file()),
+        Ok(ft) => (ft.is_dir(), ft.is_file()),
+        Err(_) => (false, false),
+    }
+}
+
 fn scan_vault_tree(dir: &std::path::Path, vault_name: &str, prefix: &str, entries: &mut Vec<String>) {
     if let Ok(dir_entries) = std::fs::read_dir(dir) {
         for entry in dir_entries.flatten() {
             let path = entry.path();
-            if path.is_dir() {
+            let (is_dir, is_file) = entry_kind(&entry, &path);
+            if is_dir {
                 if let Some(name) = path.file_name().and_then(|n| n.to_str()) {
                     if !name.starts_with('.') {
                         let dir_relative = format!("{}{}/", prefix, name);
@@ -377,7 +409,7 @@ fn scan_vault_tree(dir: &std::path::Path, vault_name: &str, prefix: &str, entrie
                         scan_vault_tree(&path, vault_name, &dir_relative, entries);
                     }
                 }
-            } else if path.is_file() && path.extension().and_then(|e| e.to_str()) == Some("md") {
+            } else if is_file && path.extension().and_then(|e| e.to_str()) == Some("md") {
                 if let Some(name) = path.file_name().and_then(|n| n.to_str()) {
                     entries.push(format!("{}/{}{}", vault_name, prefix, name));
                 }
@@ -393,10 +425,6 @@ fn get_files() -> Result<Vec<String>, String> {
         .and_then(|n| n.to_str())
         .unwrap_or("Vault");
     
-    // 初始化常规子目录（必须在扫描前创建，否则新库连空文件夹都看不到）
-    let _ = fs::create_dir_all(vault_path.join("pages"));
-    let _ = fs::create_dir_all(vault_path.join("journals"));
-    
     let mut entries = Vec::new();
     // 递归全量深度扫描：返回所有 md 文件 + 所有目录节点
     scan_vault_tree(&vault_path, vault_name, "", &mut entries);
@@ -412,17 +440,19 @@ fn load_file(file_name: &str) -> Result<String, String> {
     let relative_path = if parts.len() == 2 { parts[1] } else { file_name };
     
     let file_path = get_vault_dir().join(relative_path);
-    if file_path.exists() {
-        fs::read_to_string(file_path).map_err(|e| format!("读取失败: {}", e))
-    } else {
-        Err("文件不存在".into())
-    }
+    // 直接读取，由 NotFound 错误判断文件是否存在，省去一次额外的 stat
+    fs::read_to_string(file_path).map_err(|e| match e.kind() {
+        std::io::ErrorKind::NotFound => "文件不存在".to_string(),
+        _ => format!("读取失败: {}", e),
+    })
 }
 
 /// 属性合并器：将原文件中的属性行（key:: value）恢复到新生成的 Markdown 中
 /// 策略：提取原文件中每个内容行及其紧随的属性行，在新输出中按内容文本匹配后注入
 fn merge_properties(original: &str, new_output: &str) -> String {
-    let prop_pattern = regex::Regex::new(r"^\s*\S+::\s").unwrap();
+    // 属性行正则只编译一次，每次保存都会调用本函数
+    static PROP_PATTERN: std::sync::OnceLock<regex::Regex> = std::sync::OnceLock::new();
+    let prop_pattern = PROP_PATTERN.get_or_init(|| regex::Regex::new(r"^\s*\S+::\s").unwrap());
     let orig_lines: Vec<&str> = original.lines().collect();
     let new_lines: Vec<&str> = new_output.lines().collect();
 
@@ -505,8 +535,6 @@ fn merge_properties(original: &str, new_output: &str) -> String {
 
 #[tauri::command]
 fn sync_to_markdown(file_name: &str, blocks_json: &str, last_write: tauri::State<'_, LastWriteTime>) -> Result<String, String> {
-    println!("[Rust Backend] Syncing to {}", file_name);
-
     let parts: Vec<&str> = file_name.splitn(2, '/').collect();
     let relative_path = if parts.len() == 2 { parts[1] } else { file_name };
 
@@ -518,16 +546,24 @@ fn sync_to_markdown(file_name: &str, blocks_json: &str, last_write: tauri::State
 
     // 属性保护机制：读取原文件的属性行，保存时合并回去
     // BlockNote 会丢弃未注册的 props（如 id::, collapsed::），这里从原文件恢复
-    let final_output = if file_path.exists() {
-        if let Ok(original) = fs::read_to_string(&file_path) {
-            merge_properties(&original, &markdown_output)
-        } else {
-            markdown_output.clone()
-        }
-    } else {
-        markdown_output.clone()
+    let original = fs::read_to_string(&file_path).ok();
+    let final_output = match &original {
+        Some(original) => merge_properties(original, &markdown_output),
+        None => markdown_output.clone(),
     };
 
+    // 内容未变化（如仅移动光标、折叠块触发的保存）时跳过写盘，也不会惊动文件监听器
+    if original.as_deref() == Some(final_output.as_str()) {
+        return Ok(format!("Unchanged, skipped writing {} bytes", final_output.len()));
+    }
+
+    // 新建文件时确保所在目录存在（如运行中 pages/ 被删除后点击 [[不存在的页面]] 自动建页）
+    if original.is_none() {
+        if let Some(parent) = file_path.parent() {
+            let _ = fs::create_dir_all(parent);
+        }
+    }
+
     // 记录写入时间戳，防止文件监听器触发自循环
     {
         let mut ts = last_write.0.lock().unwrap();
@@ -561,6 +597,7 @@ fn set_vault_path(new_path: String) -> Result<(), String> {
         
     fs::write(&config_path, content)
         .map_err(|e| format!("配置保存失败: {}", e))?;
+    *VAULT_DIR.lock().unwrap() = Some(Path::new(&new_path).to_path_buf());
     
     // 初始化子目录
     let _ = fs::create_dir_all(Path::new(&new_path).join("pages"));
@@ -587,11 +624,10 @@ fn delete_file(file_name: &str) -> Result<(), String> {
     let relative_path = if parts.len() == 2 { parts[1] } else { file_name };
     
     let file_path = get_vault_dir().join(relative_path);
-    if file_path.exists() {
-        fs::remove_file(file_path).map_err(|e| format!("文件删除失败: {}", e))
-    } else {
-        Err("文件不存在".into())
-    }
+    fs::remove_file(file_path).map_err(|e| match e.kind() {
+        std::io::ErrorKind::NotFound => "文件不存在".to_string(),
+        _ => format!("文件删除失败: {}", e),
+    })
 }
 
 #[tauri::command]
@@ -643,14 +679,15 @@ fn collect_md_files(dir: &std::path::Path, vault_name: &str, prefix: &str, out:
     if let Ok(entries) = std::fs::read_dir(dir) {
         for entry in entries.flatten() {
             let path = entry.path();
-            if path.is_dir() {
+            let (is_dir, is_file) = entry_kind(&entry, &path);
+            if is_dir {
                 if let Some(name) = path.file_name().and_then(|n| n.to_str()) {
                     if !name.starts_with('.') {
                         let sub = format!("{}{}/", prefix, name);
                         collect_md_files(&path, vault_name, &sub, out);
                     }
                 }
-            } else if path.is_file() && path.extension().and_then(|e| e.to_str()) == Some("md") {
+            } else if is_file && path.extension().and_then(|e| e.to_str()) == Some("md") {
                 if let Some(name) = path.file_name().and_then(|n| n.to_str()) {
                     let id = format!("{}/{}{}", vault_name, prefix, name);
                     out.push((id, path.clone()));
@@ -660,8 +697,71 @@ fn collect_md_files(dir: &std::path::Path, vault_name: &str, prefix: &str, out:
     }
 }
 
+// 按原顺序逐个把文件内容交给 visit，visit 返回 false 时不再读取后续文件。
+// 多核时每次检索只启动一组工作线程，通过共享下标领取文件并发读取（I/O 密集，可重叠磁盘等待），
+// 主线程按下标重排后依次处理；单核时直接顺序读取，省去线程开销
+fn for_each_file_content(
+    files: &[(String, std::path::PathBuf)],
+    mut visit: impl FnMut(usize, Option<String>) -> bool,
+) {
+    let workers = thread::available_parallelism().map(|n| n.get()).unwrap_or(4).min(8).min(files.len());
+    if workers <= 1 {
+        for (idx, (_, path)) in files.iter().enumerate() {
+            if !visit(idx, fs::read_to_string(path).ok()) { return; }
+        }
+        return;
+    }
+
+    let next = AtomicUsize::new(0);
+    let stop = AtomicBool::new(false);
+    let (tx, rx) = std::sync::mpsc::channel();
+    thread::scope(|scope| {
+        for _ in 0..workers {
+            let tx = tx.clone();
+            let (next, stop) = (&next, &stop);
+            scope.spawn(move || {
+                while !stop.load(Ordering::Relaxed) {
+                    let idx = next.fetch_add(1, Ordering::Relaxed);
+                    let Some((_, path)) = files.get(idx) else { break };
+                    if tx.send((idx, fs::read_to_string(path).ok())).is_err() { break; }
+                }
+            });
+        }
+        drop(tx);
+
+        // 工作线程完成顺序不定，先暂存，等轮到的下标到齐再处理
+        let mut pending: std::collections::HashMap<usize, Option<String>> = std::collections::HashMap::new();
+        let mut expected = 0;
+        for (idx, content) in rx {
+            pending.insert(idx, content);
+            while let Some(content) = pending.remove(&expected) {
+                if !visit(expected, content) {
+                    stop.store(true, Ordering::Relaxed);
+                    return;
+                }
+                expected += 1;
+            }
+        }
+    });
+}
+
+// 纯文本检索：整文件只转一次小写，不含关键词的文件直接跳过逐行扫描；
+// 转小写不会增删 \n、\r，小写文本与原文逐行一一对应，用小写行匹配、返回原文行（下标从 0 开始）
+fn plain_matching_lines<'a>(content: &'a str, query_lower: &str) -> Vec<(usize, &'a str)> {
+    let lower = content.to_lowercase();
+    if !lower.contains(query_lower) {
+        return vec![];
+    }
+    lower.lines()
+        .zip(content.lines())
+        .enumerate()
+        .filter(|(_, (lower_line, _))| lower_line.contains(query_lower))
+        .map(|(idx, (_, line))| (idx, line))
+        .collect()
+}
+
 #[tauri::command]
-fn search_vault(query: &str, is_regex: bool) -> Result<Vec<SearchMatch>, String> {
+fn search_vault(query: &str, is_regex: bool, limit: Option<usize>) -> Result<Vec<SearchMatch>, String> {
     if query.is_empty() {
         return Ok(vec![]);
     }
@@ -675,120 +775,139 @@ fn search_vault(query: &str, is_regex: bool) -> Result<Vec<SearchMatch>, String>
     collect_md_files(&vault_path, vault_name, "", &mut all_files);
 
     let mut results: Vec<SearchMatch> = Vec::new();
-    let max_results = 200; // 防止内存爆炸
+    let max_results = limit.unwrap_or(200); // 防止内存爆炸；调用方未指定时默认 200 条
 
-    if is_regex {
-        let re = regex::Regex::new(query)
-            .map_err(|e| format!("正则表达式语法错误: {}", e))?;
+    let re = if is_regex {
+        Some(regex::Regex::new(query).map_err(|e| format!("正则表达式语法错误: {}", e))?)
+    } else {
+        None
+    };
+    let query_lower = query.to_lowercase();
+    let is_match = |text: &str| match &re {
+        Some(re) => re.is_match(text),
+        None => text.to_lowercase().contains(&query_lower),
+    };
 
-        for (file_id, file_path) in &all_files {
-            if results.len() >= max_results { break; }
+    // 并发读取文件内容，按原顺序逐个匹配；凑满结果后通知工作线程停止读取
+    for_each_file_content(&all_files, |idx, content| {
+        let (file_id, file_path) = &all_files[idx];
+
+        // 文件名匹配
+        let fname = file_path.file_name().and_then(|n| n.to_str()).unwrap_or("");
+        if is_match(fname) {
+            results.push(SearchMatch {
+                file_path: file_id.clone(),
+                line_num: 0,
+                line_text: fname.to_string(),
+                match_type: "filename".into(),
+            });
+        }
 
-            // 文件名匹配
-            let fname = file_path.file_name().and_then(|n| n.to_str()).unwrap_or("");
-            if re.is_match(fname) {
+        // 内容逐行匹配
+        if let Some(content) = content {
+            let matched: Vec<(usize, &str)> = match &re {
+                Some(re) => content.lines().enumerate().filter(|(_, line)| re.is_match(line)).collect(),
+                None => plain_matching_lines(&content, &query_lower),
+            };
+            for (idx, line) in matched {
+                if results.len() >= max_results { break; }
                 results.push(SearchMatch {
                     file_path: file_id.clone(),
-                    line_num: 0,
-                    line_text: fname.to_string(),
-                    match_type: "filename".into(),
+                    line_num: idx + 1,
+                    line_text: line.chars().take(200).collect(),
+                    match_type: "content".into(),
                 });
             }
-
-            // 内容逐行匹配
-            if let Ok(content) = fs::read_to_string(file_path) {
-                for (idx, line) in content.lines().enumerate() {
-                    if results.len() >= max_results { break; }
-                    if re.is_match(line) {
-                        results.push(SearchMatch {
-                            file_path: file_id.clone(),
-                            line_num: idx + 1,
-                            line_text: line.chars().take(200).collect(),
-                            match_type: "content".into(),
-                        });
-                    }
-                }
-            }
         }
-    } else {
-        let query_lower = query.to_lowercase();
 
-        for (file_id, file_path) in &all_files {
-            if results.len() >= max_results { break; }
+        results.len() < max_results
+    });
 
-            let fname = file_path.file_name().and_then(|n| n.to_str()).unwrap_or("");
-            if fname.to_lowercase().contains(&query_lower) {
-                results.push(SearchMatch {
-                    file_path: file_id.clone(),
-                    line_num: 0,
-                    line_text: fname.to_string(),
-                    match_type: "filename".into(),
-                });
+    Ok(results)
+}
+
+// 块 UUID -> 所在文件 的缓存索引，避免每次块引用解析都全库读取
+struct BlockRefIndex(Mutex<std::collections::HashMap<String, std::path::PathBuf>>);
+
+/// 定位包含 `id:: <uuid>` 的文件，返回 (文件 ID, 文件路径, 文件内容)
+/// 先按缓存路径读取单个文件校验；未命中（文件被删/改名/切换 Vault）才退回全库扫描，
+/// 扫描途中顺带登记遇到的所有块 UUID，后续引用可直接命中
+fn locate_block_file(uuid: &str, index: &BlockRefIndex) -> Option<(String, std::path::PathBuf, String)> {
+    let vault = get_vault_dir();
+    let vault_name = vault.file_name().and_then(|n| n.to_str()).unwrap_or("Vault");
+    let id_pattern = format!("id:: {}", uuid);
+    let has_block = |content: &str| {
+        content.contains(&id_pattern) && content.lines().any(|l| l.trim_start().starts_with(&id_pattern))
+    };
+
+    let cached = index.0.lock().unwrap().get(uuid).cloned();
+    if let Some(path) = cached {
+        if let (Ok(rel_path), Ok(content)) = (path.strip_prefix(&vault), fs::read_to_string(&path)) {
+            if has_block(&content) {
+                let file_id = format!("{}/{}", vault_name, rel_path.to_string_lossy().replace("\\", "/"));
+                return Some((file_id, path, content));
             }
+        }
+    }
 
-            if let Ok(content) = fs::read_to_string(file_path) {
-                for (idx, line) in content.lines().enumerate() {
-                    if results.len() >= max_results { break; }
-                    if line.to_lowercase().contains(&query_lower) {
-                        results.push(SearchMatch {
-                            file_path: file_id.clone(),
-                            line_num: idx + 1,
-                            line_text: line.chars().take(200).collect(),
-                            match_type: "content".into(),
-                        });
+    let mut all_files: Vec<(String, std::path::PathBuf)> = Vec::new();
+    collect_md_files(&vault, vault_name, "", &mut all_files);
+
+    let mut map = index.0.lock().unwrap();
+    for (file_id, file_path) in all_files {
+        if let Ok(content) = fs::read_to_string(&file_path) {
+            if content.contains("id:: ") {
+                for line in content.lines() {
+                    if let Some(id) = line.trim_start().strip_prefix("id:: ") {
+                        map.insert(id.trim().to_string(), file_path.clone());
                     }
                 }
             }
+            if has_block(&content) {
+                return Some((file_id, file_path, content));
+            }
         }
     }
-
-    Ok(results)
+    None
 }
 
-/// 块引用解析：扫描 Vault 中所有 .md 文件，找到包含 `id:: <uuid>` 的块，返回该块的文本内容
+/// 块引用解析：定位包含 `id:: <uuid>` 的块所在文件，返回该块的文本内容
 #[tauri::command]
-fn resolve_block_ref(uuid: &str) -> Result<serde_json::Value, String> {
-    let vault = get_vault_dir();
-    let vault_name = vault.file_name().and_then(|n| n.to_str()).unwrap_or("Vault");
-    let mut all_files: Vec<(String, std::path::PathBuf)> = Vec::new();
-    collect_md_files(&vault, vault_name, "", &mut all_files);
-
+fn resolve_block_ref(uuid: &str, block_index: tauri::State<'_, BlockRefIndex>) -> Result<serde_json::Value, String> {
+    let (file_id, _file_path, content) = locate_block_file(uuid, &block_index)
+        .ok_or_else(|| format!("未找到 UUID: {}", uuid))?;
     let id_pattern = format!("id:: {}", uuid);
 
-    for (file_id, file_path) in &all_files {
-        if let Ok(content) = fs::read_to_string(file_path) {
-            let lines: Vec<&str> = content.lines().collect();
-            for (idx, line) in lines.iter().enumerate() {
-                if line.trim() == id_pattern || line.trim().starts_with(&id_pattern) {
-                    // 找到 id:: 行，往上找到对应的内容行
-                    // 内容行是 id:: 行的前一行（同缩进层级的非属性行）
-                    let mut content_line = String::new();
-                    if idx > 0 {
-                        // 向上搜索最近的非属性行
-                        let mut k = idx as i64 - 1;
-                        while k >= 0 {
-                            let prev = lines[k as usize].trim();
-                            // 跳过其他属性行
-                            if prev.contains(":: ") && !prev.starts_with("- ") && !prev.starts_with("# ") {
-                                k -= 1;
-                                continue;
-                            }
-                            // 去掉列表前缀
-                            content_line = if prev.starts_with("- ") {
-                                prev[2..].to_string()
-                            } else {
-                                prev.to_string()
-                            };
-                            break;
-                        }
+    let lines: Vec<&str> = content.lines().collect();
+    for (idx, line) in lines.iter().enumerate() {
+        if line.trim_start().starts_with(&id_pattern) {
+            // 找到 id:: 行，往上找到对应的内容行
+            // 内容行是 id:: 行的前一行（同缩进层级的非属性行）
+            let mut content_line = String::new();
+            if idx > 0 {
+                // 向上搜索最近的非属性行
+                let mut k = idx as i64 - 1;
+                while k >= 0 {
+                    let prev = lines[k as usize].trim();
+                    // 跳过其他属性行
+                    if prev.contains(":: ") && !prev.starts_with("- ") && !prev.starts_with("# ") {
+                        k -= 1;
+                        continue;
                     }
-                    return Ok(serde_json::json!({
-                        "content": content_line,
-                        "file_path": file_id,
-                        "line_num": idx + 1
-                    }));
+                    // 去掉列表前缀
+                    content_line = if prev.starts_with("- ") {
+                        prev[2..].to_string()
+                    } else {
+                        prev.to_string()
+                    };
+                    break;
                 }
             }
+            return Ok(serde_json::json!({
+                "content": content_line,
+                "file_path": file_id,
+                "line_num": idx + 1
+            }));
         }
     }
 
@@ -797,50 +916,44 @@ fn resolve_block_ref(uuid: &str) -> Result<serde_json::Value, String> {
 
 /// 块内容更新：定位源文件中 UUID 对应的块，替换其文本内容
 #[tauri::command]
-fn update_block_content(uuid: &str, new_content: &str) -> Result<(), String> {
-    let vault = get_vault_dir();
-    let vault_name = vault.file_name().and_then(|n| n.to_str()).unwrap_or("Vault");
-    let mut all_files: Vec<(String, std::path::PathBuf)> = Vec::new();
-    collect_md_files(&vault, vault_name, "", &mut all_files);
-
+fn update_block_content(uuid: &str, new_content: &str, block_index: tauri::State<'_, BlockRefIndex>) -> Result<(), String> {
+    let (_file_id, file_path, content) = locate_block_file(uuid, &block_index)
+        .ok_or_else(|| format!("未找到 UUID: {}", uuid))?;
     let id_pattern = format!("id:: {}", uuid);
 
-    for (_file_id, file_path) in &all_files {
-        if let Ok(content) = fs::read_to_string(file_path) {
-            let lines: Vec<&str> = content.lines().collect();
-            for (idx, line) in lines.iter().enumerate() {
-                if line.trim() == id_pattern || line.trim().starts_with(&id_pattern) {
-                    if idx > 0 {
-                        // 向上找到内容行
-                        let mut k = idx as i64 - 1;
-                        while k >= 0 {
-                            let prev = lines[k as usize].trim();
-                            if prev.contains(":: ") && !prev.starts_with("- ") && !prev.starts_with("# ") {
-                                k -= 1;
-                                continue;
-                            }
-                            break;
-                        }
-                        if k >= 0 {
-                            let target_idx = k as usize;
-                            let old_line = lines[target_idx];
-                            // 保留原始缩进和列表前缀
-                            let indent_match: String = old_line.chars().take_while(|c| c.is_whitespace()).collect();
-                            let has_bullet = old_line.trim_start().starts_with("- ");
-                            let new_line = if has_bullet {
-                                format!("{}- {}", indent_match, new_content)
-                            } else {
-                                format!("{}{}", indent_match, new_content)
-                            };
-
-                            let mut new_lines: Vec<String> = lines.iter().map(|l| l.to_string()).collect();
-                            new_lines[target_idx] = new_line;
-                            let new_file_content = new_lines.join("\n");
-                            fs::write(file_path, new_file_content)
-                                .map_err(|e| format!("写入失败: {}", e))?;
-                            return Ok(());
-                        }
+    let lines: Vec<&str> = content.lines().collect();
+    for (idx, line) in lines.iter().enumerate() {
+        if line.trim_start().starts_with(&id_pattern) {
+            if idx > 0 {
+                // 向上找到内容行
+                let mut k = idx as i64 - 1;
+                while k >= 0 {
+                    let prev = lines[k as usize].trim();
+                    if prev.contains(":: ") && !prev.starts_with("- ") && !prev.starts_with("# ") {
+                        k -= 1;
+                        continue;
                     }
+                    break;
+                }
+                if k >= 0 {
+                    let target_idx = k as usize;
+                    let old_line = lines[target_idx];
+                    // 保留原始缩进和列表前缀
+                    let indent_match: String = old_line.chars().take_while(|c| c.is_whitespace()).collect();
+                    let has_bullet = old_line.trim_start().starts_with("- ");
+                    let new_line = if has_bullet {
+                        format!("{}- {}", indent_match, new_content)
+                    } else {
+                        format!("{}{}", indent_match, new_content)
+                    };
+
+                    // 仅替换目标行的切片引用，其余行直接借用原文，避免逐行复制为 String
+                    let mut new_lines = lines.clone();
+                    new_lines[target_idx] = &new_line;
+                    let new_file_content = new_lines.join("\n");
+                    fs::write(&file_path, new_file_content)
+                        .map_err(|e| format!("写入失败: {}", e))?;
+                    return Ok(());
                 }
             }
         }
@@ -852,12 +965,33 @@ fn update_block_content(uuid: &str, new_content: &str) -> Result<(), String> {
 // 共享的"最后一次写入的时间"状态
 struct LastWriteTime(Arc<Mutex<Instant>>);
 
+// 监听事件路径是否与笔记相关：忽略隐藏目录（.git、.obsidian 等）内的变化，
+// 以及图片等非 Markdown 普通文件（目录与 .md 文件才会影响文件树和内容）
+fn is_relevant_watch_path(path: &Path, root: &Path) -> bool {
+    // notify 上报的路径不一定与 watch_dir 字面一致（相对路径被展开为绝对路径、
+    // macOS FSEvents 返回规范化路径等），无法判断时保守地视为相关
+    let rel = match path.strip_prefix(root) {
+        Ok(rel) => rel,
+        Err(_) => return true,
+    };
+    let is_hidden = |c: std::path::Component| c.as_os_str().to_string_lossy().starts_with('.');
+    if rel.parent().is_some_and(|parent| parent.components().any(is_hidden)) {
+        return false;
+    }
+    if path.extension().and_then(|e| e.to_str()) == Some("md") {
+        return true;
+    }
+    // 已删除的路径无法判断类型，保守地视为可能的目录
+    !rel.components().next_back().is_some_and(is_hidden) && !path.is_file()
+}
+
 #[cfg_attr(mobile, tauri::mobile_entry_point)]
 pub fn run() {
     let last_write = Arc::new(Mutex::new(Instant::now() - Duration::from_secs(10)));
 
     tauri::Builder::default()
         .manage(LastWriteTime(last_write.clone()))
+        .manage(BlockRefIndex(Mutex::new(std::collections::HashMap::new())))
         .plugin(tauri_plugin_sql::Builder::new().build())
         .plugin(tauri_plugin_opener::init())
         .plugin(tauri_plugin_dialog::init())
@@ -885,56 +1019,124 @@ pub fn run() {
 
                 println!("[Rust Watcher] Directory watcher active...");
 
-                for res in rx {
-                    match res {
-                        Ok(event) => {
-                            let elapsed = {
-                                let ts = last_write_clone.lock().unwrap();
-                                ts.elapsed()
-                            };
-                            // 防抖：忽略自身写入后 2 秒内的事件
-                            if elapsed < Duration::from_secs(2) {
-                                continue;
-                            }
+                // 判断是否处于自身写入后的 2 秒防抖窗口内（在收到事件时判断）
+                let is_own_write = || last_write_clone.lock().unwrap().elapsed() < Duration::from_secs(2);
 
-                            let is_structure_change = event.kind.is_create()
-                                || event.kind.is_remove()
-                                || matches!(event.kind, notify::EventKind::Modify(notify::event::ModifyKind::Name(_)));
+                // 每个文件最近一次推送给前端的内容哈希：仅 touch、未改内容的事件不再重复推送
+                let mut content_hashes: std::collections::HashMap<std::path::PathBuf, u64> = std::collections::HashMap::new();
 
-                            // 结构变化（新增/删除/重命名）→ 通知前端刷新文件树
-                            if is_structure_change {
-                                println!("[Rust Watcher] Structure change: {:?}", event.kind);
-                                let _ = handle.emit("vault-changed", ());
-                            }
+                let is_relevant = |res: &notify::Result<notify::Event>| match res {
+                    Ok(event) => event.paths.iter().any(|p| is_relevant_watch_path(p, &watch_dir)),
+                    Err(_) => true,
+                };
+
+                while let Ok(first) = rx.recv() {
+                    // 无关事件（如 git 操作 .git 目录）直接丢弃，也不会开启一个新的合并窗口
+                    if !is_relevant(&first) {
+                        continue;
+                    }
+                    // 合并突发事件：编辑器一次保存往往连续触发多个事件，
+                    // 等待静默 200ms（最长 1 秒）后再统一处理整批。
+                    // 静默期从最后一个相关事件起算，无关事件不会延长等待
+                    let quiet = Duration::from_millis(200);
+                    let max_wait = Duration::from_secs(1);
+                    let mut batch = vec![(first, is_own_write())];
+                    let batch_start = Instant::now();
+                    let mut last_relevant = batch_start;
+                    loop {
+                        let (since_last, since_start) = (last_relevant.elapsed(), batch_start.elapsed());
+                        if since_last >= quiet || since_start >= max_wait {
+                            break;
+                        }
+                        match rx.recv_timeout((quiet - since_last).min(max_wait - since_start)) {
+                            Ok(res) => {
+                                if is_relevant(&res) {
+                                    batch.push((res, is_own_write()));
+                                    last_relevant = Instant::now();
+                                }
+                            },
+                            Err(_) => break,
+                        }
+                    }
 
-                            // 内容变化 → 通知前端热更新文件内容
-                            if event.kind.is_modify() {
-                                if let Some(path) = event.paths.first() {
-                                    if path.is_file() && path.extension().and_then(|e| e.to_str()) == Some("md") {
-                                        if let Ok(rel_path) = path.strip_prefix(&watch_dir) {
-                                            let rel_path_str = format!("{}/{}", vault_name, rel_path.to_string_lossy().replace("\\", "/"));
-                                            println!("[Rust Watcher] Content change: {}", rel_path_str);
-                                            match fs::read_to_string(path) {
-                                                Ok(content) => {
-                                                    #[derive(serde::Serialize, Clone)]
-                                                    struct FileChangePayload {
-                                                        file_name: String,
-                                                        content: String,
-                                                    }
-                                                    let payload = FileChangePayload {
-                                                        file_name: rel_path_str,
-                                                        content,
-                                                    };
-                                                    let _ = handle.emit("md-file-changed", payload);
-                                                },
-                                                Err(e) => println!("[Rust Watcher] Read error: {}", e),
-                                            }
+                    let mut structure_changed = false;
+                    // Vec 保持事件顺序，HashSet 负责 O(1) 去重（git checkout 等一批可能有上千个路径）
+                    let mut changed_paths: Vec<std::path::PathBuf> = Vec::new();
+                    let mut seen_paths: std::collections::HashSet<std::path::PathBuf> = std::collections::HashSet::new();
+                    for (res, own_write) in batch {
+                        match res {
+                            Ok(event) if own_write => {
+                                // 自身写入不通知前端，但文件内容已变，需让对应的哈希缓存失效
+                                for p in &event.paths {
+                                    content_hashes.remove(p);
+                                }
+                            },
+                            Ok(event) => {
+                                let is_structure_change = event.kind.is_create()
+                                    || event.kind.is_remove()
+                                    || matches!(event.kind, notify::EventKind::Modify(notify::event::ModifyKind::Name(_)));
+                                if is_structure_change {
+                                    structure_changed = true;
+                                }
+                                if event.kind.is_remove() {
+                                    for p in &event.paths {
+                                        content_hashes.remove(p);
+                                    }
+                                }
+                                // 仅元数据变化（访问时间、权限等）不涉及内容，无需重读文件
+                                let is_content_change = event.kind.is_modify()
+                                    && !matches!(event.kind, notify::EventKind::Modify(notify::event::ModifyKind::Metadata(_)));
+                                // 同一文件在一批内的多次修改只处理一次
+                                if is_content_change {
+                                    if let Some(path) = event.paths.first() {
+                                        if seen_paths.insert(path.clone()) {
+                                            changed_paths.push(path.clone());
                                         }
                                     }
                                 }
+                            },
+                            Err(e) => println!("[Rust Watcher] Watch error: {:?}", e),
+                        }
+                    }
+
+                    // 结构变化（新增/删除/重命名）→ 通知前端刷新文件树，每批只通知一次
+                    if structure_changed {
+                        println!("[Rust Watcher] Structure change");
+                        let _ = handle.emit("vault-changed", ());
+                    }
+
+                    // 内容变化 → 通知前端热更新文件内容，整批合并为一次事件发送
+                    #[derive(serde::Serialize, Clone)]
+                    struct FileChangePayload {
+                        file_name: String,
+                        content: String,
+                    }
+                    let mut payloads: Vec<FileChangePayload> = Vec::new();
+                    for path in &changed_paths {
+                        if path.is_file() && path.extension().and_then(|e| e.to_str()) == Some("md") {
+                            if let Ok(rel_path) = path.strip_prefix(&watch_dir) {
+                                let rel_path_str = format!("{}/{}", vault_name, rel_path.to_string_lossy().replace("\\", "/"));
+                                match fs::read_to_string(path) {
+                                    Ok(content) => {
+                                        let mut hasher = std::collections::hash_map::DefaultHasher::new();
+                                        std::hash::Hash::hash(&content, &mut hasher);
+                                        let hash = std::hash::Hasher::finish(&hasher);
+                                        if content_hashes.insert(path.clone(), hash) == Some(hash) {
+                                            continue;
+                                        }
+                                        payloads.push(FileChangePayload {
+                                            file_name: rel_path_str,
+                                            content,
+                                        });
+                                    },
+                                    Err(e) => println!("[Rust Watcher] Read error: {}", e),
+                                }
                             }
-                        },
-                        Err(e) => println!("[Rust Watcher] Watch error: {:?}", e),
+                        }
+                    }
+                    if !payloads.is_empty() {
+                        println!("[Rust Watcher] Content change: {} file(s)", payloads.len());
+                        let _ = handle.emit("md-files-changed", payloads);
                     }
                 }
             });
@@ -944,3 +1146,30 @@ pub fn run() {
         .run(tauri::generate_context!())
         .expect("error while running tauri application");
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn plain_matching_lines_agree_with_per_line_lowercase() {
+        let contents = [
+            "first line\nfoo a\rb\r\nlast",
+            "- Hello World\r\n  id:: 1234\r\n",
+            "Σίσυφος\nΣΊΣΥΦΟΣ ΚΑΙ\n",
+            "",
+        ];
+        let queries = ["foo", "HELLO", "world\r", "σίσυφος", "ΚΑΙ", "missing"];
+
+        for content in contents {
+            for query in queries {
+                let query_lower = query.to_lowercase();
+                let expected: Vec<(usize, &str)> = content.lines()
+                    .enumerate()
+                    .filter(|(_, line)| line.to_lowercase().contains(&query_lower))
+                    .collect();
+                assert_eq!(plain_matching_lines(content, &query_lower), expected, "{:?} on {:?}", query, content);
+            }
+        }
+    }
+}
@@ -51,6 +51,20 @@ const customSchema = BlockNoteSchema.create({
 // 但因为 BlockNote 自身的架构限制，最彻底的"原样保存"做法是拦截底层 update。
 // 由于 BlockNote Schema 开发极其复杂，我们在这里改为在 `useCreateBlockNote` 层做初始化的预保存。
 
+// 转义正则元字符（与 Rust regex::escape 的集合一致），让页面名按字面量参与后端正则检索
+function escapeRegex(text: string): string {
+  return text.replace(/[\\.+*?()|[\]{}^$#&\-~]/g, '\\$&');
+}
+
+// 前进/后退导航栈的最大记录数
+const NAV_HISTORY_LIMIT = 100;
+
+// 编辑时检测 wikilink 的正则：每次按键都会用到，提升为模块常量
+// 已闭合的 [[xxx]]
+const WIKILINK_CLOSED_REGEX = /\[\[([^\]]+)\]\]/;
+// 光标前未闭合的 [[xxx
+const WIKILINK_OPEN_REGEX = /\[\[([^\]]*)$/;
+
 // 核心编辑器组件：通过 React Key 强制挂载/卸载以解决 React Hook 生命周期竞态（窜稿 Bug）
 function EditorArea({
   file,
@@ -105,14 +119,27 @@ function EditorArea({
   const saveTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
 
   const [wikiSuggest, setWikiSuggest] = useState<{ active: boolean, query: string, blockId: string | null }>({ active: false, query: "", blockId: null });
-  const suggestedFiles = allFiles.filter(f => f.toLowerCase().includes(wikiSuggest.query.toLowerCase()));
+  // 小写匹配键只在文件列表变化时重建，避免每次渲染都对全部文件重复 toLowerCase
+  const lowerFiles = useMemo(() => allFiles.map(f => [f, f.toLowerCase()] as const), [allFiles]);
+  // 建议列表只在弹窗打开且查询或文件列表变化时重新计算，编辑器的其他重渲染直接复用
+  const suggestedFiles = useMemo(() => {
+    if (!wikiSuggest.active) return [];
+    const suggestQuery = wikiSuggest.query.toLowerCase();
+    return lowerFiles.filter(([, key]) => key.includes(suggestQuery)).map(([f]) => f);
+  }, [lowerFiles, wikiSuggest.active, wikiSuggest.query]);
 
   useEffect(() => {
-    const unlisten = listen<{ file_name: string, content: string }>("md-file-changed", (event) => {
-      window.dispatchEvent(new CustomEvent("evo-block-sync", { detail: event.payload.file_name }));
-      if (event.payload.file_name === file) {
+    // 后端每批文件变化只发一次事件，载荷为变化文件列表
+    const unlisten = listen<Array<{ file_name: string, content: string }>>("md-files-changed", (event) => {
+      let otherFileChanged = false;
+      for (const change of event.payload) {
+        window.dispatchEvent(new CustomEvent("evo-block-sync", { detail: change.file_name }));
+        if (change.file_name !== file) {
+          otherFileChanged = true;
+          continue;
+        }
         try {
-          const newBlocks = markdownToBlocks(event.payload.content);
+          const newBlocks = markdownToBlocks(change.content);
           if (newBlocks.length > 0) {
             fullAstRef.current = newBlocks;
             let nextBlocks = newBlocks;
@@ -130,9 +157,9 @@ function EditorArea({
             }, 1000);
           }
         } catch (err) { }
-      } else {
-        refreshSidebar();
       }
+      // 其他文件的变化只需刷新一次侧边栏
+      if (otherFileChanged) refreshSidebar();
     });
 
     const onEvoNavigate = (e: any) => {
@@ -251,14 +278,15 @@ function EditorArea({
         }
 
         // 检测 [[xxx]] 完整闭合 -> 自动转换为 wikilink 节点
-        const closedMatch = fullText.match(/\[\[([^\]]+)\]\]/);
+        const closedMatch = fullText.match(WIKILINK_CLOSED_REGEX);
         if (closedMatch) {
           const pageName = closedMatch[1];
+          const needle = `[[${pageName}]]`;
           const blockContent = [...(cursorInfo.block.content as any[])];
           for (let idx = blockContent.length - 1; idx >= 0; idx--) {
             const item = blockContent[idx];
-            if (item.type === "text" && item.text.includes(`[[${pageName}]]`)) {
-              const parts = item.text.split(`[[${pageName}]]`);
+            if (item.type === "text" && item.text.includes(needle)) {
+              const parts = item.text.split(needle);
               const replacements: any[] = [];
               if (parts[0]) replacements.push({ type: "text", text: parts[0], styles: item.styles });
               replacements.push({ type: "wikilink", props: { page: pageName } });
@@ -273,7 +301,7 @@ function EditorArea({
         }
 
         // 检测未闭合 [[ -> 弹出建议
-        const match = fullText.match(/\[\[([^\]]*)$/);
+        const match = fullText.match(WIKILINK_OPEN_REGEX);
         if (match) {
           setWikiSuggest({ active: true, query: match[1], blockId: cursorInfo.block.id });
         } else {
@@ -321,19 +349,15 @@ function EditorArea({
     if (!pageName) return;
     (async () => {
       try {
+        // [[页面]] 与 #tag 两种形式合并为一次忽略大小写的正则检索，只遍历一遍 Vault；
+        // 两种形式共用一个结果上限，因此按每种 200 条放宽到 400 条
+        const name = escapeRegex(pageName);
         const results = await invoke<any[]>('search_vault', {
-          query: `[[${pageName}]]`,
-          isRegex: false,
+          query: `(?i)\\[\\[${name}\\]\\]|#${name}`,
+          isRegex: true,
+          limit: 400,
         });
-        // 也搜索 #tag 形式
-        const tagResults = await invoke<any[]>('search_vault', {
-          query: `#${pageName}`,
-          isRegex: false,
-        });
-        const allRefs = [...results, ...tagResults]
-          .filter(r => r.file_path !== file) // 排除自身
-          .filter((r, i, arr) => arr.findIndex(x => x.file_path === r.file_path && x.line_num === r.line_num) === i);
-        setBacklinks(allRefs);
+        setBacklinks(results.filter(r => r.file_path !== file)); // 排除自身
       } catch { setBacklinks([]); }
     })();
   }, [file]);
@@ -427,6 +451,18 @@ function App() {
   const [navIndex, setNavIndex] = useState(-1);
   const [targetBlockId, setTargetBlockId] = useState<string | null>(null);
 
+  // 路径集合随文件列表重建一次，导航时的存在性判断为 O(1) 查找
+  const fileSet = useMemo(() => new Set(files), [files]);
+  // Vault 相对路径 → 完整路径：[[页面]] 跳转优先走等值查找，不必对整个列表做后缀扫描
+  const relPathIndex = useMemo(() => {
+    const index = new Map<string, string>();
+    for (const f of files) {
+      const slash = f.indexOf('/');
+      if (slash !== -1) index.set(f.slice(slash + 1), f);
+    }
+    return index;
+  }, [files]);
+
   const navigateTo = useCallback((filePath: string) => {
     let resolvedPath = filePath;
     let hash: string | null = null;
@@ -434,16 +470,22 @@ function App() {
       [resolvedPath, hash] = filePath.split("#");
     }
 
-    if (!files.includes(resolvedPath)) {
-      // 尝试在文件列表中模糊匹配
-      const match = files.find(f => f.endsWith('/' + resolvedPath) || f.endsWith('/' + resolvedPath.replace(/^pages\//, '')));
+    if (!fileSet.has(resolvedPath)) {
+      // 先按 Vault 相对路径等值查找，未命中再退回后缀模糊匹配（后缀在循环外一次性拼好）
+      const bareRelPath = resolvedPath.replace(/^pages\//, '');
+      let match = relPathIndex.get(resolvedPath) ?? relPathIndex.get(bareRelPath);
+      if (!match) {
+        const suffix = '/' + resolvedPath;
+        const bareSuffix = '/' + bareRelPath;
+        match = files.find(f => f.endsWith(suffix) || f.endsWith(bareSuffix));
+      }
       if (match) {
         resolvedPath = match;
       } else {
         // 尝试用当前文件的 Vault 前缀拼接
         const currentVault = currentFile?.split('/')[0] || '';
         const prefixed = currentVault ? `${currentVault}/${filePath}` : filePath;
-        if (files.includes(prefixed)) {
+        if (fileSet.has(prefixed)) {
           resolvedPath = prefixed;
         } else {
           // 页面不存在，自动创建
@@ -456,15 +498,17 @@ function App() {
     }
 
     const finalNavPath = hash ? `${resolvedPath}#${hash}` : resolvedPath;
+    // 超出容量时丢弃最早的记录，导航栈长度恒定有上限
+    const keepFrom = Math.max(0, navIndex + 2 - NAV_HISTORY_LIMIT);
     setNavHistory(prev => {
-      const newHistory = prev.slice(0, navIndex + 1);
+      const newHistory = prev.slice(keepFrom, navIndex + 1);
       newHistory.push(finalNavPath);
       return newHistory;
     });
-    setNavIndex(prev => prev + 1);
+    setNavIndex(navIndex + 1 - keepFrom);
     setCurrentFile(resolvedPath);
     setTargetBlockId(hash);
-  }, [navIndex, files, currentFile]);
+  }, [navIndex, files, fileSet, relPathIndex, currentFile]);
 
   const applyNavHistory = (index: number, history: string[]) => {
     const pathWithHash = history[index];
@@ -515,6 +559,9 @@ function App() {
     async function initDB() {
       try {
         const database = await Database.load("sqlite:evonote.db");
+        // WAL：写入不再重写回滚日志，读写互不阻塞。journal_mode 持久保存在库文件中，对连接池里的所有连接生效；
+        // synchronous 等按连接生效的 PRAGMA 只会落到执行它的那一个池连接上，这里不设置
+        await database.execute("PRAGMA journal_mode=WAL");
         await database.execute(
           "CREATE TABLE IF NOT EXISTS files_cache (file_path TEXT PRIMARY KEY, content TEXT)"
         );
@@ -531,10 +578,12 @@ function App() {
   // 获取文件列表及配置
   const fetchFiles = async (forceSelect?: string) => {
     try {
-      const vPath = await invoke<string>("get_vault_path");
+      // 两次调用互不依赖，并发发出以重叠后端的磁盘读取
+      const [vPath, fileList] = await Promise.all([
+        invoke<string>("get_vault_path"),
+        invoke<string[]>("get_files"),
+      ]);
       setVaultPath(vPath);
-
-      const fileList = await invoke<string[]>("get_files");
       setFiles(fileList);
 
       if (forceSelect) {
@@ -631,7 +680,7 @@ function App() {
     try {
       await invoke("sync_to_markdown", { fileName: targetFileName, blocksJson: defaultInitBlock });
       if (db) {
-        await db.execute("INSERT OR REPLACE INTO files_cache (file_path, content) VALUES ($1, $2)", [targetFileName, defaultInitBlock]);
+        await db.execute("INSERT INTO files_cache (file_path, content) VALUES ($1, $2) ON CONFLICT(file_path) DO UPDATE SET content=excluded.content", [targetFileName, defaultInitBlock]);
       }
       await fetchFiles(targetFileName);
     } catch (e) {
@@ -654,7 +703,7 @@ function App() {
     const defaultInitBlock = '[{"type":"paragraph","content":[]}]';
     await invoke("sync_to_markdown", { fileName: fn, blocksJson: defaultInitBlock });
     if (db) {
-      await db.execute("INSERT OR REPLACE INTO files_cache (file_path, content) VALUES ($1, $2)", [fn, defaultInitBlock]);
+      await db.execute("INSERT INTO files_cache (file_path, content) VALUES ($1, $2) ON CONFLICT(file_path) DO UPDATE SET content=excluded.content", [fn, defaultInitBlock]);
     }
     fetchFiles();
     return fn;
@@ -811,7 +860,6 @@ function App() {
                   onMouseLeave={(e) => (e.currentTarget.style.background = 'transparent')}
                   onClick={async () => {
                     try {
-                      const vaultPath = await invoke<string>('get_vault_path');
                       const parts = currentFile!.split('/');
                       parts.shift();
                       const filePath = vaultPath + '\\' + parts.join('\\');
@@ -826,7 +874,6 @@ function App() {
                   onMouseLeave={(e) => (e.currentTarget.style.background = 'transparent')}
                   onClick={async () => {
                     try {
-                      const vaultPath = await invoke<string>('get_vault_path');
                       const parts = currentFile!.split('/');
                       parts.shift();
                       const filePath = vaultPath + '\\' + parts.join('\\');
@@ -841,7 +888,6 @@ function App() {
                   onMouseLeave={(e) => (e.currentTarget.style.background = 'transparent')}
                   onClick={async () => {
                     try {
-                      const vaultPath = await invoke<string>('get_vault_path');
                       const parts = currentFile!.split('/');
                       parts.shift();
                       const filePath = vaultPath + '\\' + parts.join('\\');
@@ -181,9 +181,10 @@ export function ResourceTree({
         if (!searchResults) return null;
         const groups = new Map<string, SearchMatch[]>();
         for (const r of searchResults) {
-            const arr = groups.get(r.file_path) || [];
-            arr.push(r);
-            groups.set(r.file_path, arr);
+            // 只在首次遇到该文件时建组，已有分组直接追加，避免每条结果都重复 set
+            const arr = groups.get(r.file_path);
+            if (arr) arr.push(r);
+            else groups.set(r.file_path, [r]);
         }
         return groups;
     }, [searchResults]);
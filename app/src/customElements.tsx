@@ -239,7 +239,6 @@ function BlockRefRender(props: any) {
             if (replaceBlockInTree(ast, uuid, newBlocks)) {
                 await invoke("sync_to_markdown", { fileName: filePath, blocksJson: JSON.stringify(ast) });
             }
-            invoke<{ content: string; file_path: string }>("resolve_block_ref", { uuid }).then(res => setContent(res.content));
             setEditing(false);
             // 触发全局重载，使当前笔记中其他的同源块及大纲获取到最新编辑状态
             window.dispatchEvent(new CustomEvent("evo-reload"));
@@ -7,6 +7,10 @@ import { v4 as uuidv4 } from "uuid";
 // Logseq 属性正则：匹配 `key:: value` 格式
 const PROP_REGEX = /^([a-zA-Z0-9_-]+)::\s*(.+)$/;
 
+// 内联格式正则：每个块都会解析一次，提升为模块常量只编译一次
+// 覆盖：**bold**, *italic*, ~~strike~~, `code`, [link](url), [[wikilink]], #tag, ((block-ref)), {{embed ((uuid))}}
+const INLINE_REGEX = /(\*\*(.+?)\*\*|\*(.+?)\*|~~(.+?)~~|`(.+?)`|\[([^\]]+)\]\(([^)]+)\)|\[\[(.+?)\]\]|(?:^|\s)(#[^\s\[\]]+)|(\(\(([a-f0-9-]{36})\)\))|(\{\{embed\s+\(\(([a-f0-9-]{36})\)\)\}\}))/g;
+
 interface BlockNoteBlock {
     id: string;
     type: string;
@@ -47,8 +51,9 @@ function parseInlineContent(
     if (!text) return [{ type: "text", text: "", styles: {} }];
 
     const result: any[] = [];
-    // 正则覆盖：**bold**, *italic*, ~~strike~~, `code`, [link](url), [[wikilink]], #tag, ((block-ref)), {{embed ((uuid))}}
-    const regex = /(\*\*(.+?)\*\*|\*(.+?)\*|~~(.+?)~~|`(.+?)`|\[([^\]]+)\]\(([^)]+)\)|\[\[(.+?)\]\]|(?:^|\s)(#[^\s\[\]]+)|(\(\(([a-f0-9-]{36})\)\))|(\{\{embed\s+\(\(([a-f0-9-]{36})\)\)\}\}))/g;
+    // 全局正则在模块内共享，每次解析前重置匹配位置
+    const regex = INLINE_REGEX;
+    regex.lastIndex = 0;
 
     let lastIndex = 0;
     let match;
@@ -148,10 +153,9 @@ export function markdownToBlocks(markdown: string): BlockNoteBlock[] {
             continue;
         }
 
-        // 计算当前行的缩进（空格数）
-        const indentMatch = line.match(/^(\s*)/);
-        const indent = indentMatch ? indentMatch[1].length : 0;
+        // 计算当前行的缩进（空格数）：直接由去除前导空白后的长度差得出，无需正则
         const trimmed = line.trimStart();
+        const indent = line.length - trimmed.length;
 
         // 收集紧随当前行的属性行（下一行如果是 `key:: value` 形式）
         const propLines: string[] = [];